@@ -170,47 +170,40 @@ def test_handle_cleaup_by_workspace_context_exit():
 
 
 def test_handle_cleaup_by_gc_without_request_context():
-
-    called = {"yup": False}
-
-    def call_me():
-        called["yup"] = True
-
     with instance_for_test() as instance:
         with define_out_of_process_workspace(__file__, "get_repo") as workspace:
             # Create a process context
             process_context = WorkspaceProcessContext(workspace=workspace, instance=instance)
             assert len(process_context.repository_locations) == 1
-            process_context.repository_locations[  # pylint: disable=protected-access
+            # The finalizer only holds a weak reference to the handle, so holding on to it here
+            # doesn't keep the handle from being garbage collected
+            finalizer = process_context.repository_locations[  # pylint: disable=protected-access
                 0
-            ]._handle.cleanup = call_me
+            ]._handle._finalizer
 
             # Reload the location from the request context
-            assert not called["yup"]
+            assert finalizer.alive
             process_context.reload_repository_location("test_location")
 
             # There are no more references to the location, so it should be GC'd
             gc.collect()
-            assert called["yup"]
+            assert not finalizer.alive
 
 
 def test_handle_cleaup_by_gc_with_dangling_request_reference():
-    called = {"yup": False}
-
-    def call_me():
-        called["yup"] = True
-
     with instance_for_test() as instance:
         with define_out_of_process_workspace(__file__, "get_repo") as workspace:
             # Create a process context
             process_context = WorkspaceProcessContext(workspace=workspace, instance=instance)
-            process_context.repository_locations[  # pylint: disable=protected-access
+            # The finalizer only holds a weak reference to the handle, so holding on to it here
+            # doesn't keep the handle from being garbage collected
+            finalizer = process_context.repository_locations[  # pylint: disable=protected-access
                 0
-            ]._handle.cleanup = call_me
+            ]._handle._finalizer
 
             assert len(process_context.repository_locations) == 1
 
-            assert not called["yup"]
+            assert finalizer.alive
 
             # The request context maintains a reference to the location handle through the
             # repository location
@@ -221,9 +214,9 @@ def call_me():
             # Even though we reload, verify the handle isn't cleaned up
             process_context.reload_repository_location("test_location")
             gc.collect()
-            assert not called["yup"]
+            assert finalizer.alive
 
             # Free reference, make sure handle is cleaned up
             request_context = None
             gc.collect()
-            assert called["yup"]
+            assert not finalizer.alive
@@ -3,14 +3,27 @@
 from dagster.utils.error import SerializableErrorInfo
 
 
-def sync_get_server_id(api_client):
-    from dagster.grpc.client import DagsterGrpcClient
-
-    check.inst_param(api_client, "api_client", DagsterGrpcClient)
-    result = check.inst(api_client.get_server_id(), (str, SerializableErrorInfo))
+def _server_id_from_result(result):
+    result = check.inst(result, (str, SerializableErrorInfo))
     if isinstance(result, SerializableErrorInfo):
         raise DagsterUserCodeProcessError(
             result.to_string(), user_code_process_error_infos=[result]
         )
     else:
         return result
+
+
+def sync_get_server_id(api_client):
+    from dagster.grpc.client import DagsterGrpcClient
+
+    check.inst_param(api_client, "api_client", DagsterGrpcClient)
+    return _server_id_from_result(api_client.get_server_id())
+
+
+def get_server_id_future(api_client):
+    """Like ``sync_get_server_id``, but returns a future that resolves to the server ID instead of
+    blocking on the response."""
+    from dagster.grpc.client import DagsterGrpcClient
+
+    check.inst_param(api_client, "api_client", DagsterGrpcClient)
+    return api_client.get_server_id_future().then(_server_id_from_result)
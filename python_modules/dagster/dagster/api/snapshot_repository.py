@@ -14,21 +14,19 @@ def sync_get_streaming_external_repositories_data_grpc(api_client, repository_lo
 
     repo_datas = {}
     for repository_name in repository_location_handle.repository_names:
-        external_repository_chunks = list(
-            api_client.streaming_external_repository(
-                external_repository_origin=ExternalRepositoryOrigin(
-                    repository_location_handle.origin,
-                    repository_name,
-                )
+        external_repository_chunks = api_client.streaming_external_repository(
+            external_repository_origin=ExternalRepositoryOrigin(
+                repository_location_handle.origin,
+                repository_name,
             )
         )
 
+        # Join the chunks as they come off the stream rather than collecting the responses first,
+        # so that only the chunk strings themselves are held before the final join
         external_repository_data = deserialize_json_to_dagster_namedtuple(
             "".join(
-                [
-                    chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
-                ]
+                chunk["serialized_external_repository_chunk"]
+                for chunk in external_repository_chunks
             )
         )
 
@@ -41,7 +41,9 @@ def __new__(
             container_image=check.opt_str_param(container_image, "container_image"),
         )
 
-    @lru_cache(maxsize=1)
+    # Processes can load several repositories in turn (e.g. a workspace with more than one
+    # in-process location), so that each of them is only loaded from the user's code once
+    @lru_cache(maxsize=128)
     def get_definition(self):
         return repository_def_from_pointer(self.pointer)
 
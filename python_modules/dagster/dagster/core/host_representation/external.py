@@ -33,16 +33,14 @@ def __init__(self, external_repository_data, repository_handle):
         self.external_repository_data = check.inst_param(
             external_repository_data, "external_repository_data", ExternalRepositoryData
         )
-        self._pipeline_index_map = OrderedDict(
-            (
-                external_pipeline_data.pipeline_snapshot.name,
-                PipelineIndex(
-                    external_pipeline_data.pipeline_snapshot,
-                    external_pipeline_data.parent_pipeline_snapshot,
-                ),
-            )
+        self._external_pipeline_data_map = OrderedDict(
+            (external_pipeline_data.pipeline_snapshot.name, external_pipeline_data)
             for external_pipeline_data in external_repository_data.external_pipeline_datas
         )
+        # Building a PipelineIndex means hashing the whole pipeline snapshot, so do it the first
+        # time each pipeline is asked for rather than for every pipeline whenever the repository
+        # is loaded
+        self._pipeline_index_map = {}
         self._handle = check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
 
         jobs_list = (
@@ -56,16 +54,25 @@ def name(self):
         return self.external_repository_data.name
 
     def get_pipeline_index(self, pipeline_name):
+        if pipeline_name not in self._pipeline_index_map:
+            external_pipeline_data = self._external_pipeline_data_map[pipeline_name]
+            self._pipeline_index_map[pipeline_name] = PipelineIndex(
+                external_pipeline_data.pipeline_snapshot,
+                external_pipeline_data.parent_pipeline_snapshot,
+            )
         return self._pipeline_index_map[pipeline_name]
 
     def has_pipeline(self, pipeline_name):
-        return pipeline_name in self._pipeline_index_map
+        return pipeline_name in self._external_pipeline_data_map
 
     def get_pipeline_indices(self):
-        return self._pipeline_index_map.values()
+        return [
+            self.get_pipeline_index(pipeline_name)
+            for pipeline_name in self._external_pipeline_data_map
+        ]
 
     def has_external_pipeline(self, pipeline_name):
-        return pipeline_name in self._pipeline_index_map
+        return pipeline_name in self._external_pipeline_data_map
 
     def get_external_schedule(self, schedule_name):
         return ExternalSchedule(
@@ -116,7 +123,7 @@ def get_full_external_pipeline(self, pipeline_name):
         )
 
     def get_all_external_pipelines(self):
-        return [self.get_full_external_pipeline(pn) for pn in self._pipeline_index_map]
+        return [self.get_full_external_pipeline(pn) for pn in self._external_pipeline_data_map]
 
     @property
     def handle(self):
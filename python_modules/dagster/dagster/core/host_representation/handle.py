@@ -1,17 +1,22 @@
+import atexit
+import logging
 import sys
 import threading
+import time
+import weakref
 from abc import ABC, abstractmethod, abstractproperty
-from collections import namedtuple
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 
 from dagster import check
-from dagster.api.get_server_id import sync_get_server_id
+from dagster.api.get_server_id import get_server_id_future
 from dagster.api.list_repositories import sync_list_repositories_grpc
 from dagster.api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
-from dagster.core.definitions.reconstructable import repository_def_from_pointer
 from dagster.core.errors import DagsterInvariantViolationError
 from dagster.core.host_representation.grpc_server_state_subscriber import (
     LocationStateChangeEvent,
     LocationStateChangeEventType,
+    LocationStateSubscriber,
 )
 from dagster.core.host_representation.origin import (
     ExternalRepositoryOrigin,
@@ -23,6 +28,9 @@
 from dagster.core.host_representation.selector import PipelineSelector
 from dagster.core.origin import RepositoryPythonOrigin
 from dagster.utils import merge_dicts
+from dagster.utils.error import serializable_error_info_from_exc_info
+
+_logger = logging.getLogger(__name__)
 
 
 def _get_repository_python_origin(
@@ -39,16 +47,205 @@ def _get_repository_python_origin(
     )
 
 
+def _intern_keys(dict_by_name):
+    # Names are looked up and compared over and over once a location is loaded, and interned
+    # strings can be compared by identity
+    return {sys.intern(name): value for name, value in dict_by_name.items()}
+
+
+def _get_container_image(client, list_repositories_response):
+    current_image_result = list_repositories_response.current_image_result
+    if current_image_result is None:
+        # Older servers don't include the image in their list of repositories
+        current_image_result = client.get_current_image()
+    return current_image_result.current_image
+
+
+def _send_state_event_to_handle(handle_ref, event):
+    handle = handle_ref()
+    if handle is not None:
+        handle._send_state_event_to_subscribers(event)  # pylint: disable=protected-access
+
+
+# Clients for unmanaged gRPC servers, shared across every handle in the process that points at the
+# same server so that they also share a single channel. Maps (host, port, socket, use_ssl) to a
+# [client, refcount] pair.
+_GRPC_CLIENT_CACHE: Dict[Tuple[str, Optional[int], Optional[str], bool], List[Any]] = {}
+_GRPC_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _acquire_grpc_client(client_key):
+    from dagster.grpc.client import DagsterGrpcClient
+
+    with _GRPC_CLIENT_CACHE_LOCK:
+        entry = _GRPC_CLIENT_CACHE.get(client_key)
+        if entry is None:
+            host, port, socket, use_ssl = client_key
+            entry = [
+                DagsterGrpcClient(
+                    port=port, socket=socket, host=host, use_ssl=use_ssl, reuse_channel=True
+                ),
+                0,
+            ]
+            _GRPC_CLIENT_CACHE[client_key] = entry
+        entry[1] += 1
+        return entry[0]
+
+
+def _release_grpc_client(client_key):
+    with _GRPC_CLIENT_CACHE_LOCK:
+        entry = _GRPC_CLIENT_CACHE[client_key]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del _GRPC_CLIENT_CACHE[client_key]
+            entry[0].close()
+
+
+class _HandleResources:
+    """Everything a location handle has to release once it's done with its server.
+
+    Kept apart from the handle itself so that they can be released after the handle has been
+    garbage collected, without anything holding on to the handle in the meantime.
+    """
+
+    __slots__ = (
+        "_lock",
+        "heartbeat_registration",
+        "watch_thread_shutdown_event",
+        "watch_thread",
+        "client_key",
+        "ephemeral_client",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.heartbeat_registration = None
+        self.watch_thread_shutdown_event = None
+        self.watch_thread = None
+        self.client_key = None
+        self.ephemeral_client = None
+
+    def release(self):
+        with self._lock:
+            _UNRELEASED_RESOURCES.discard(self)
+            self._release()
+
+    def _release(self):
+        if self.heartbeat_registration:
+            from dagster.grpc.client import CLIENT_HEARTBEAT_SCHEDULER
+
+            CLIENT_HEARTBEAT_SCHEDULER.unregister(self.heartbeat_registration)
+            self.heartbeat_registration = None
+
+        if self.watch_thread_shutdown_event:
+            self.watch_thread_shutdown_event.set()
+            self.watch_thread_shutdown_event = None
+
+        # cleanup() can be called by a state subscriber, which runs on the watch thread itself
+        if self.watch_thread and self.watch_thread is not threading.current_thread():
+            self.watch_thread.join()
+            self.watch_thread = None
+
+        if self.client_key:
+            _release_grpc_client(self.client_key)
+            self.client_key = None
+
+        if self.ephemeral_client:
+            self.ephemeral_client.cleanup_server()
+            self.ephemeral_client = None
+
+
+# A handle's finalizer can run on any thread, at any point that thread allocates, including while
+# it holds one of the non-reentrant locks that releasing the handle's resources takes (e.g. the
+# client cache lock above, or the heartbeat scheduler's lock). So rather than releasing them
+# itself, the finalizer only appends the resources to a deque, which takes no locks, and a
+# background thread releases them from there.
+RELEASE_POLL_INTERVAL = 0.5
+
+_UNRELEASED_RESOURCES: Set[_HandleResources] = set()
+_PENDING_RELEASES: Deque[_HandleResources] = deque()
+_RELEASE_THREAD = None
+_RELEASE_THREAD_LOCK = threading.Lock()
+
+
+def _track_resources(resources):
+    global _RELEASE_THREAD  # pylint: disable=global-statement
+
+    with _RELEASE_THREAD_LOCK:
+        _UNRELEASED_RESOURCES.add(resources)
+
+        # Also covers a thread that didn't survive a fork
+        if not _RELEASE_THREAD or not _RELEASE_THREAD.is_alive():
+            _RELEASE_THREAD = threading.Thread(
+                target=_run_release_thread, name="location-handle-release", daemon=True
+            )
+            _RELEASE_THREAD.start()
+
+
+def _create_finalizer(handle, resources):
+    _track_resources(resources)
+    finalizer = weakref.finalize(handle, _PENDING_RELEASES.append, resources)
+    # Anything still unreleased when the process exits is released by _release_all_resources
+    finalizer.atexit = False
+    return finalizer
+
+
+def _release_pending_resources():
+    while True:
+        try:
+            resources = _PENDING_RELEASES.popleft()
+        except IndexError:
+            return
+
+        try:
+            resources.release()
+        except Exception:  # pylint: disable=broad-except
+            _logger.error(
+                "Error releasing a garbage collected repository location handle:\n{}".format(
+                    serializable_error_info_from_exc_info(sys.exc_info())
+                )
+            )
+
+
+def _run_release_thread():
+    global _RELEASE_THREAD  # pylint: disable=global-statement
+
+    while True:
+        time.sleep(RELEASE_POLL_INTERVAL)
+        _release_pending_resources()
+
+        # Resources pending release stay tracked until they're released, so nothing is left
+        # behind once there are none
+        with _RELEASE_THREAD_LOCK:
+            if not _UNRELEASED_RESOURCES:
+                _RELEASE_THREAD = None
+                return
+
+
+@atexit.register
+def _release_all_resources():
+    _release_pending_resources()
+    for resources in list(_UNRELEASED_RESOURCES):
+        resources.release()
+
+
+# The dagster.grpc modules import from this package, so the handles below import them where
+# they're used, and only on the code paths that actually need them
+
+
 class RepositoryLocationHandle(ABC):
+    # Workspaces can hold many location handles for the life of the process, so the subclasses
+    # declare their attributes up front rather than giving every instance a __dict__. Handles
+    # that hold on to a server are weakly referenced by the finalizer that has their resources
+    # released if they are garbage collected without cleanup() having been called.
+    __slots__ = ("__weakref__",)
+
     def __enter__(self):
         return self
 
     def __exit__(self, exception_type, exception_value, traceback):
         self.cleanup()
 
-    def __del__(self):
-        self.cleanup()
-
     def cleanup(self):
         pass
 
@@ -76,6 +273,27 @@ class GrpcServerRepositoryLocationHandle(RepositoryLocationHandle):
     Represents a gRPC server that Dagster is not responsible for managing.
     """
 
+    __slots__ = (
+        "_origin",
+        "_port",
+        "_socket",
+        "_host",
+        "_use_ssl",
+        "_resources",
+        "_finalizer",
+        "_heartbeat",
+        "_watch_server",
+        "_state_subscribers",
+        "_state_subscribers_lock",
+        "_external_repositories_data",
+        "server_id",
+        "client",
+        "repository_names",
+        "executable_path",
+        "repository_code_pointer_dict",
+        "container_image",
+    )
+
     def __init__(
         self,
         origin,
@@ -86,9 +304,6 @@ def __init__(
         heartbeat=False,
         watch_server=True,
     ):
-        from dagster.grpc.client import DagsterGrpcClient, client_heartbeat_thread
-        from dagster.grpc.server_watcher import create_grpc_watch_thread
-
         self._origin = check.inst_param(origin, "origin", RepositoryLocationOrigin)
 
         if isinstance(self._origin, GrpcServerRepositoryLocationOrigin):
@@ -102,11 +317,8 @@ def __init__(
             self._host = check.str_param(host, "host")
             self._use_ssl = False
 
-        self._watch_thread_shutdown_event = None
-        self._watch_thread = None
-
-        self._heartbeat_shutdown_event = None
-        self._heartbeat_thread = None
+        self._resources = _HandleResources()
+        self._finalizer = _create_finalizer(self, self._resources)
 
         self._heartbeat = check.bool_param(heartbeat, "heartbeat")
         self._watch_server = check.bool_param(watch_server, "watch_server")
@@ -114,70 +326,89 @@ def __init__(
         self.server_id = None
         self._external_repositories_data = None
 
+        pending_futures = []
+
         try:
-            self.client = DagsterGrpcClient(
-                port=self._port,
-                socket=self._socket,
-                host=self._host,
-                use_ssl=self._use_ssl,
-            )
+            client_key = (self._host, self._port, self._socket, self._use_ssl)
+            self.client = _acquire_grpc_client(client_key)
+            self._resources.client_key = client_key
+
+            # Keep the server ID query in flight while we block on the list of repositories
+            server_id_future = None if server_id else get_server_id_future(self.client)
+            if server_id_future:
+                pending_futures.append(server_id_future)
+
             list_repositories_response = sync_list_repositories_grpc(self.client)
 
-            self.server_id = server_id if server_id else sync_get_server_id(self.client)
-            self.repository_names = set(
-                symbol.repository_name for symbol in list_repositories_response.repository_symbols
+            self.server_id = server_id if server_id else server_id_future.result()
+            self.repository_names = frozenset(
+                sys.intern(symbol.repository_name)
+                for symbol in list_repositories_response.repository_symbols
             )
 
             if self._heartbeat:
-                self._heartbeat_shutdown_event = threading.Event()
-
-                self._heartbeat_thread = threading.Thread(
-                    target=client_heartbeat_thread,
-                    args=(
-                        self.client,
-                        self._heartbeat_shutdown_event,
-                    ),
-                    name="grpc-client-heartbeat",
+                from dagster.grpc.client import CLIENT_HEARTBEAT_SCHEDULER
+
+                self._resources.heartbeat_registration = CLIENT_HEARTBEAT_SCHEDULER.register(
+                    self.client
                 )
-                self._heartbeat_thread.daemon = True
-                self._heartbeat_thread.start()
 
             if self._watch_server:
-                self._state_subscribers = []
-                self._watch_thread_shutdown_event, self._watch_thread = create_grpc_watch_thread(
-                    self.client,
-                    on_updated=lambda new_server_id: self._send_state_event_to_subscribers(
+                from dagster.grpc.server_watcher import create_grpc_watch_thread
+
+                # Replaced rather than modified when a subscriber is added, so that the watch
+                # thread can send events to the subscribers without taking a lock
+                self._state_subscribers: Tuple[LocationStateSubscriber, ...] = ()
+                self._state_subscribers_lock = threading.Lock()
+
+                # The watch thread only holds a weak reference to the handle, so that it does not
+                # keep the handle (and the resources released by its finalizer) alive
+                handle_ref = weakref.ref(self)
+                location_name = self.location_name
+
+                def on_updated(new_server_id):
+                    _send_state_event_to_handle(
+                        handle_ref,
                         LocationStateChangeEvent(
                             LocationStateChangeEventType.LOCATION_UPDATED,
-                            location_name=self.location_name,
+                            location_name=location_name,
                             message="Server has been updated.",
                             server_id=new_server_id,
-                        )
-                    ),
-                    on_error=lambda: self._send_state_event_to_subscribers(
+                        ),
+                    )
+
+                def on_error():
+                    _send_state_event_to_handle(
+                        handle_ref,
                         LocationStateChangeEvent(
                             LocationStateChangeEventType.LOCATION_ERROR,
-                            location_name=self.location_name,
+                            location_name=location_name,
                             message="Unable to reconnect to server. You can reload the server once it is "
                             "reachable again",
-                        )
-                    ),
+                        ),
+                    )
+
+                watch_thread_shutdown_event, watch_thread = create_grpc_watch_thread(
+                    self.client, on_updated=on_updated, on_error=on_error,
                 )
 
-                self._watch_thread.start()
+                self._resources.watch_thread_shutdown_event = watch_thread_shutdown_event
+                self._resources.watch_thread = watch_thread
+                watch_thread.start()
 
             self.executable_path = list_repositories_response.executable_path
-            self.repository_code_pointer_dict = (
+            self.repository_code_pointer_dict = _intern_keys(
                 list_repositories_response.repository_code_pointer_dict
             )
 
-            self.container_image = self._reload_current_image()
+            self.container_image = _get_container_image(self.client, list_repositories_response)
 
-            self._external_repositories_data = sync_get_streaming_external_repositories_data_grpc(
-                self.client,
-                self,
+            self._external_repositories_data = _intern_keys(
+                sync_get_streaming_external_repositories_data_grpc(self.client, self)
             )
         except:
+            for future in pending_futures:
+                future.cancel()
             self.cleanup()
             raise
 
@@ -186,30 +417,22 @@ def origin(self):
         return self._origin
 
     def add_state_subscriber(self, subscriber):
+        check.inst_param(subscriber, "subscriber", LocationStateSubscriber)
         if self._watch_server:
-            self._state_subscribers.append(subscriber)
+            with self._state_subscribers_lock:
+                self._state_subscribers = self._state_subscribers + (subscriber,)
 
     def _send_state_event_to_subscribers(self, event):
-        check.inst_param(event, "event", LocationStateChangeEvent)
+        # Only ever called by the watch callbacks with the events they create, and subscribers are
+        # checked once when they're added rather than on every event
         for subscriber in self._state_subscribers:
             subscriber.handle_event(event)
 
     def cleanup(self):
-        if self._heartbeat_shutdown_event:
-            self._heartbeat_shutdown_event.set()
-            self._heartbeat_shutdown_event = None
-
-        if self._watch_thread_shutdown_event:
-            self._watch_thread_shutdown_event.set()
-            self._watch_thread_shutdown_event = None
-
-        if self._heartbeat_thread:
-            self._heartbeat_thread.join()
-            self._heartbeat_thread = None
-
-        if self._watch_thread:
-            self._watch_thread.join()
-            self._watch_thread = None
+        # Released right away rather than on the release thread, and detaching the finalizer
+        # keeps it from releasing them again once the handle is collected
+        if self._finalizer.detach():
+            self._resources.release()
 
     @property
     def port(self):
@@ -231,9 +454,6 @@ def use_ssl(self):
     def location_name(self):
         return self.origin.location_name
 
-    def _reload_current_image(self):
-        return self.client.get_current_image().current_image
-
     def get_repository_python_origin(self, repository_name):
         return _get_repository_python_origin(
             self.executable_path,
@@ -275,14 +495,27 @@ class ManagedGrpcPythonEnvRepositoryLocationHandle(RepositoryLocationHandle):
     A Python environment for which Dagster is managing a gRPC server.
     """
 
+    __slots__ = (
+        "_origin",
+        "_external_repositories_data",
+        "_repository_names",
+        "_resources",
+        "_finalizer",
+        "grpc_server_process",
+        "client",
+        "repository_code_pointer_dict",
+        "container_image",
+    )
+
     def __init__(self, origin):
-        from dagster.grpc.client import client_heartbeat_thread
+        from dagster.grpc.client import CLIENT_HEARTBEAT_SCHEDULER
         from dagster.grpc.server import GrpcServerProcess
 
         self.grpc_server_process = None
         self.client = None
-        self.heartbeat_shutdown_event = None
-        self.heartbeat_thread = None
+
+        self._resources = _HandleResources()
+        self._finalizer = _create_finalizer(self, self._resources)
 
         self._origin = check.inst_param(
             origin, "origin", ManagedGrpcPythonEnvRepositoryLocationOrigin
@@ -298,30 +531,22 @@ def __init__(self, origin):
             )
 
             self.client = self.grpc_server_process.create_ephemeral_client()
+            self._resources.ephemeral_client = self.client
 
-            self.heartbeat_shutdown_event = threading.Event()
-
-            self.heartbeat_thread = threading.Thread(
-                target=client_heartbeat_thread,
-                args=(
-                    self.client,
-                    self.heartbeat_shutdown_event,
-                ),
-                name="grpc-client-heartbeat",
+            self._resources.heartbeat_registration = CLIENT_HEARTBEAT_SCHEDULER.register(
+                self.client
             )
-            self.heartbeat_thread.daemon = True
-            self.heartbeat_thread.start()
 
             list_repositories_response = sync_list_repositories_grpc(self.client)
 
-            self.repository_code_pointer_dict = (
+            self.repository_code_pointer_dict = _intern_keys(
                 list_repositories_response.repository_code_pointer_dict
             )
-            self.container_image = self.client.get_current_image().current_image
+            self._repository_names = frozenset(self.repository_code_pointer_dict)
+            self.container_image = _get_container_image(self.client, list_repositories_response)
 
-            self._external_repositories_data = sync_get_streaming_external_repositories_data_grpc(
-                self.client,
-                self,
+            self._external_repositories_data = _intern_keys(
+                sync_get_streaming_external_repositories_data_grpc(self.client, self)
             )
         except:
             self.cleanup()
@@ -367,7 +592,7 @@ def loadable_target_origin(self):
 
     @property
     def repository_names(self):
-        return set(self.repository_code_pointer_dict.keys())
+        return self._repository_names
 
     @property
     def host(self):
@@ -386,17 +611,11 @@ def use_ssl(self):
         return False
 
     def cleanup(self):
-        if self.heartbeat_shutdown_event:
-            self.heartbeat_shutdown_event.set()
-            self.heartbeat_shutdown_event = None
-
-        if self.heartbeat_thread:
-            self.heartbeat_thread.join()
-            self.heartbeat_thread = None
-
-        if self.client:
-            self.client.cleanup_server()
-            self.client = None
+        # Released right away rather than on the release thread, and detaching the finalizer
+        # keeps it from releasing them again once the handle is collected
+        if self._finalizer.detach():
+            self._resources.release()
+        self.client = None
 
     @property
     def is_cleaned_up(self):
@@ -417,12 +636,16 @@ def get_display_metadata(self):
 
 
 class InProcessRepositoryLocationHandle(RepositoryLocationHandle):
+    __slots__ = ("_origin", "repository_code_pointer_dict")
+
     def __init__(self, origin):
         self._origin = check.inst_param(origin, "origin", InProcessRepositoryLocationOrigin)
 
-        pointer = self.origin.recon_repo.pointer
-        repo_def = repository_def_from_pointer(pointer)
-        self.repository_code_pointer_dict = {repo_def.name: pointer}
+        # Goes through the repository's own cached definition, which the location built from this
+        # handle loads from too, so the user's code is only loaded once
+        recon_repo = self.origin.recon_repo
+        repo_def = recon_repo.get_definition()
+        self.repository_code_pointer_dict = {sys.intern(repo_def.name): recon_repo.pointer}
 
     @property
     def origin(self):
@@ -446,94 +669,221 @@ def create_location(self):
         return InProcessRepositoryLocation(self)
 
 
-class RepositoryHandle(
-    namedtuple("_RepositoryHandle", "repository_name repository_location_handle")
-):
-    def __new__(cls, repository_name, repository_location_handle):
-        return super(RepositoryHandle, cls).__new__(
-            cls,
-            check.str_param(repository_name, "repository_name"),
+class _Handle:
+    """Base for the small records that identify a definition on a repository location.
+
+    Subclasses assign their attributes, along with the hash of the attributes that identify them,
+    directly in ``__init__``, and define ``__eq__`` over those identifying attributes, which they
+    list in ``_fields`` for repr and pickling. Handles are treated as immutable once constructed,
+    so anything derived from a handle can be computed once and kept on it.
+
+    Handles are constructed often, and only from values the framework has already validated, so
+    their parameter checks are skipped when Python runs with ``-O``.
+    """
+
+    __slots__ = ("_hash",)
+    _fields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Defining __eq__ on a class otherwise sets its __hash__ to None
+        cls.__hash__ = _Handle.__hash__
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return (type(self), tuple(getattr(self, field) for field in self._fields))
+
+    def __repr__(self):
+        return "{cls}({args})".format(
+            cls=type(self).__name__,
+            args=", ".join(
+                "{field}={value!r}".format(field=field, value=getattr(self, field))
+                for field in self._fields
+            ),
+        )
+
+
+class RepositoryHandle(_Handle):
+    __slots__ = (
+        "repository_name",
+        "repository_location_handle",
+        "location_name",
+        "_external_origin",
+        "_python_origin",
+    )
+    _fields = ("repository_name", "repository_location_handle")
+
+    def __init__(self, repository_name, repository_location_handle):
+        if __debug__:
+            check.str_param(repository_name, "repository_name")
             check.inst_param(
                 repository_location_handle, "repository_location_handle", RepositoryLocationHandle
-            ),
+            )
+        self.repository_name = sys.intern(repository_name)
+        self.repository_location_handle = repository_location_handle
+        # Resolved once here, so that handles built off of this one can copy it rather than walking
+        # down to the location's origin
+        self.location_name = sys.intern(repository_location_handle.location_name)
+        self._external_origin = None
+        self._python_origin = None
+        self._hash = hash((self.repository_name, repository_location_handle))
+
+    def __eq__(self, other):
+        return self is other or (
+            type(self) is type(other)
+            and self._hash == other._hash
+            and self.repository_name == other.repository_name
+            and self.repository_location_handle == other.repository_location_handle
         )
 
     def get_external_origin(self):
-        return ExternalRepositoryOrigin(
-            self.repository_location_handle.origin,
-            self.repository_name,
-        )
+        if self._external_origin is None:
+            self._external_origin = ExternalRepositoryOrigin(
+                self.repository_location_handle.origin,
+                self.repository_name,
+            )
+        return self._external_origin
 
     def get_python_origin(self):
-        return self.repository_location_handle.get_repository_python_origin(self.repository_name)
-
-
-class PipelineHandle(namedtuple("_PipelineHandle", "pipeline_name repository_handle")):
-    def __new__(cls, pipeline_name, repository_handle):
-        return super(PipelineHandle, cls).__new__(
-            cls,
-            check.str_param(pipeline_name, "pipeline_name"),
-            check.inst_param(repository_handle, "repository_handle", RepositoryHandle),
+        if self._python_origin is None:
+            self._python_origin = self.repository_location_handle.get_repository_python_origin(
+                self.repository_name
+            )
+        return self._python_origin
+
+
+class PipelineHandle(_Handle):
+    __slots__ = (
+        "pipeline_name",
+        "repository_handle",
+        "repository_name",
+        "location_name",
+        "_string",
+        "_external_origin",
+        "_python_origin",
+    )
+    _fields = ("pipeline_name", "repository_handle")
+
+    def __init__(self, pipeline_name, repository_handle):
+        if __debug__:
+            check.str_param(pipeline_name, "pipeline_name")
+            check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
+        self.pipeline_name = sys.intern(pipeline_name)
+        self.repository_handle = repository_handle
+        # Resolved once here since these are read for every event logged during a run
+        self.repository_name = repository_handle.repository_name
+        self.location_name = repository_handle.location_name
+        self._string = None
+        self._external_origin = None
+        self._python_origin = None
+        self._hash = hash((self.pipeline_name, repository_handle._hash))
+
+    def __eq__(self, other):
+        return self is other or (
+            type(self) is type(other)
+            and self._hash == other._hash
+            and self.pipeline_name == other.pipeline_name
+            and self.repository_handle == other.repository_handle
         )
 
     def to_string(self):
-        return "{self.location_name}.{self.repository_name}.{self.pipeline_name}".format(self=self)
-
-    @property
-    def repository_name(self):
-        return self.repository_handle.repository_name
-
-    @property
-    def location_name(self):
-        return self.repository_handle.repository_location_handle.location_name
+        if self._string is None:
+            self._string = f"{self.location_name}.{self.repository_name}.{self.pipeline_name}"
+        return self._string
 
     def get_external_origin(self):
-        return self.repository_handle.get_external_origin().get_pipeline_origin(self.pipeline_name)
+        if self._external_origin is None:
+            self._external_origin = (
+                self.repository_handle.get_external_origin().get_pipeline_origin(
+                    self.pipeline_name
+                )
+            )
+        return self._external_origin
 
     def get_python_origin(self):
-        return self.repository_handle.get_python_origin().get_pipeline_origin(self.pipeline_name)
+        if self._python_origin is None:
+            self._python_origin = self.repository_handle.get_python_origin().get_pipeline_origin(
+                self.pipeline_name
+            )
+        return self._python_origin
 
     def to_selector(self):
         return PipelineSelector(self.location_name, self.repository_name, self.pipeline_name, None)
 
 
-class JobHandle(namedtuple("_JobHandle", "job_name repository_handle")):
-    def __new__(cls, job_name, repository_handle):
-        return super(JobHandle, cls).__new__(
-            cls,
-            check.str_param(job_name, "job_name"),
-            check.inst_param(repository_handle, "repository_handle", RepositoryHandle),
+class JobHandle(_Handle):
+    __slots__ = (
+        "job_name",
+        "repository_handle",
+        "repository_name",
+        "location_name",
+        "_external_origin",
+    )
+    _fields = ("job_name", "repository_handle")
+
+    def __init__(self, job_name, repository_handle):
+        if __debug__:
+            check.str_param(job_name, "job_name")
+            check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
+        self.job_name = sys.intern(job_name)
+        self.repository_handle = repository_handle
+        self.repository_name = repository_handle.repository_name
+        self.location_name = repository_handle.location_name
+        self._external_origin = None
+        self._hash = hash((self.job_name, repository_handle._hash))
+
+    def __eq__(self, other):
+        return self is other or (
+            type(self) is type(other)
+            and self._hash == other._hash
+            and self.job_name == other.job_name
+            and self.repository_handle == other.repository_handle
         )
 
-    @property
-    def repository_name(self):
-        return self.repository_handle.repository_name
-
-    @property
-    def location_name(self):
-        return self.repository_handle.repository_location_handle.location_name
-
     def get_external_origin(self):
-        return self.repository_handle.get_external_origin().get_job_origin(self.job_name)
+        if self._external_origin is None:
+            self._external_origin = self.repository_handle.get_external_origin().get_job_origin(
+                self.job_name
+            )
+        return self._external_origin
 
 
-class PartitionSetHandle(namedtuple("_PartitionSetHandle", "partition_set_name repository_handle")):
-    def __new__(cls, partition_set_name, repository_handle):
-        return super(PartitionSetHandle, cls).__new__(
-            cls,
-            check.str_param(partition_set_name, "partition_set_name"),
-            check.inst_param(repository_handle, "repository_handle", RepositoryHandle),
+class PartitionSetHandle(_Handle):
+    __slots__ = (
+        "partition_set_name",
+        "repository_handle",
+        "repository_name",
+        "location_name",
+        "_external_origin",
+    )
+    _fields = ("partition_set_name", "repository_handle")
+
+    def __init__(self, partition_set_name, repository_handle):
+        if __debug__:
+            check.str_param(partition_set_name, "partition_set_name")
+            check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
+        self.partition_set_name = sys.intern(partition_set_name)
+        self.repository_handle = repository_handle
+        self.repository_name = repository_handle.repository_name
+        self.location_name = repository_handle.location_name
+        self._external_origin = None
+        self._hash = hash((self.partition_set_name, repository_handle._hash))
+
+    def __eq__(self, other):
+        return self is other or (
+            type(self) is type(other)
+            and self._hash == other._hash
+            and self.partition_set_name == other.partition_set_name
+            and self.repository_handle == other.repository_handle
         )
 
-    @property
-    def repository_name(self):
-        return self.repository_handle.repository_name
-
-    @property
-    def location_name(self):
-        return self.repository_handle.repository_location_handle.location_name
-
     def get_external_origin(self):
-        return self.repository_handle.get_external_origin().get_partition_set_origin(
-            self.partition_set_name
-        )
+        if self._external_origin is None:
+            self._external_origin = (
+                self.repository_handle.get_external_origin().get_partition_set_origin(
+                    self.partition_set_name
+                )
+            )
+        return self._external_origin
@@ -2,6 +2,7 @@
 import signal
 import sys
 import tempfile
+import threading
 import time
 from contextlib import contextmanager
 
@@ -202,8 +203,12 @@ def register_managed_run_for_test(
 
 
 def poll_for_finished_run(instance, run_id=None, timeout=20, run_tags=None):
-    total_time = 0
+    from dagster.core.events import DagsterEventType
+
     interval = 0.01
+    # Upper bound on how long to go without checking on a run that we're watching, in case the
+    # event that finishes it is missed
+    watch_interval = 0.5
 
     filters = PipelineRunsFilter(
         run_ids=[run_id] if run_id else None,
@@ -211,16 +216,44 @@ def poll_for_finished_run(instance, run_id=None, timeout=20, run_tags=None):
         statuses=[PipelineRunStatus.SUCCESS, PipelineRunStatus.FAILURE, PipelineRunStatus.CANCELED],
     )
 
-    while True:
-        runs = instance.get_runs(filters, limit=1)
-        if runs:
-            return runs[0]
-        else:
-            time.sleep(interval)
-            total_time += interval
-            if total_time > timeout:
+    # If we know which run to wait for, watch its event log for the event that finishes it rather
+    # than querying for the run every interval
+    finished_event = None
+    if run_id:
+        finished_event = threading.Event()
+        finished_event_types = {
+            DagsterEventType.PIPELINE_SUCCESS,
+            DagsterEventType.PIPELINE_FAILURE,
+            DagsterEventType.PIPELINE_INIT_FAILURE,
+            DagsterEventType.PIPELINE_CANCELED,
+        }
+
+        def _on_event(record):
+            if record.is_dagster_event and record.dagster_event.event_type in finished_event_types:
+                finished_event.set()
+
+        instance.watch_event_logs(run_id, -1, _on_event)
+
+    try:
+        start_time = time.time()
+        while True:
+            runs = instance.get_runs(filters, limit=1)
+            if runs:
+                return runs[0]
+
+            remaining = timeout - (time.time() - start_time)
+            if remaining <= 0:
                 raise Exception("Timed out")
 
+            # Once the run has finished, its status will follow shortly after
+            if finished_event and not finished_event.is_set():
+                finished_event.wait(min(watch_interval, remaining))
+            else:
+                time.sleep(interval)
+    finally:
+        if run_id:
+            instance.end_watch_event_logs(run_id, _on_event)
+
 
 def poll_for_step_start(instance, run_id, timeout=30):
     poll_for_event(instance, run_id, event_type="STEP_START", message=None, timeout=timeout)
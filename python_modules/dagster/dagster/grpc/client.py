@@ -1,7 +1,13 @@
+import heapq
+import itertools
+import logging
 import os
 import subprocess
 import sys
+import threading
+import time
 import warnings
+import weakref
 from contextlib import contextmanager
 
 import grpc
@@ -32,25 +38,83 @@
 
 CLIENT_HEARTBEAT_INTERVAL = 1
 
+_logger = logging.getLogger(__name__)
 
-def client_heartbeat_thread(client, shutdown_event):
-    while True:
-        shutdown_event.wait(CLIENT_HEARTBEAT_INTERVAL)
-        if shutdown_event.is_set():
-            break
+# Reconnect to a server behind a reused channel at about the same cadence that the server watcher
+# polls it, rather than backing off for up to grpc's default of two minutes
+REUSED_CHANNEL_OPTIONS = [
+    ("grpc.initial_reconnect_backoff_ms", 1000),
+    ("grpc.max_reconnect_backoff_ms", 1000),
+]
 
+
+class DagsterGrpcQueryFuture:
+    """The pending result of a unary query issued with ``DagsterGrpcClient._query_future``.
+
+    If the query was issued on a channel of its own, holds on to that channel so that it stays
+    open until the response has been received. Applies ``response_fn`` to the raw response in
+    ``result``.
+    """
+
+    def __init__(self, future, response_fn, owned_channel=None):
+        self._future = future
+        self._response_fn = check.callable_param(response_fn, "response_fn")
+        self._owned_channel = owned_channel
+
+    def then(self, fn):
+        check.callable_param(fn, "fn")
+        response_fn = self._response_fn
+        return DagsterGrpcQueryFuture(
+            self._future, lambda response: fn(response_fn(response)), self._owned_channel
+        )
+
+    def _close_owned_channel(self):
+        if self._owned_channel:
+            self._owned_channel.close()
+
+    def result(self, timeout=None):
         try:
-            client.heartbeat("ping")
-        except grpc._channel._InactiveRpcError:  # pylint: disable=protected-access
-            continue
+            response = self._future.result(timeout=timeout)
+        finally:
+            # A wait that times out leaves the query in flight, and closing its channel would
+            # cancel it out from under a later call to result
+            if self._future.done():
+                self._close_owned_channel()
+        return self._response_fn(response)
+
+    def done(self):
+        return self._future.done()
+
+    def add_done_callback(self, fn):
+        check.callable_param(fn, "fn")
+        self._future.add_done_callback(lambda _future: fn(self))
+
+    def cancel(self):
+        self._future.cancel()
+        self._close_owned_channel()
 
 
 class DagsterGrpcClient:
-    def __init__(self, port=None, socket=None, host="localhost", use_ssl=False):
+    """Client for the Dagster gRPC API.
+
+    By default, each query opens and closes a channel of its own. If ``reuse_channel`` is set,
+    the client instead opens one channel on first use and shares it across queries until
+    ``close`` is called, avoiding a fresh connection handshake per query. Queries made after
+    ``close`` go back to opening a channel of their own.
+    """
+
+    def __init__(
+        self, port=None, socket=None, host="localhost", use_ssl=False, reuse_channel=False
+    ):
         self.port = check.opt_int_param(port, "port")
         self.socket = check.opt_str_param(socket, "socket")
         self.host = check.opt_str_param(host, "host")
         self._use_ssl = check.bool_param(use_ssl, "use_ssl")
+        self._reuse_channel = check.bool_param(reuse_channel, "reuse_channel")
+
+        self._reused_channel = None
+        self._reused_channel_closed = False
+        self._reused_channel_lock = threading.Lock()
 
         self._ssl_creds = grpc.ssl_channel_credentials() if use_ssl else None
 
@@ -72,14 +136,44 @@ def __init__(self, port=None, socket=None, host="localhost", use_ssl=False):
         else:
             self._server_address = "unix:" + os.path.abspath(socket)
 
+    def _create_channel(self, options=None):
+        return (
+            grpc.secure_channel(self._server_address, self._ssl_creds, options=options)
+            if self._use_ssl
+            else grpc.insecure_channel(self._server_address, options=options)
+        )
+
+    def _get_reused_channel(self):
+        """Return the channel shared by queries on the client, or None if the client doesn't
+        reuse channels or has been closed."""
+        if not self._reuse_channel:
+            return None
+
+        with self._reused_channel_lock:
+            # Once closed, nothing will ever close a new shared channel again, so queries that are
+            # still made on the client (e.g. by a handle that has since been cleaned up) each
+            # open and close a channel of their own instead
+            if self._reused_channel is None and not self._reused_channel_closed:
+                self._reused_channel = self._create_channel(options=REUSED_CHANNEL_OPTIONS)
+            return self._reused_channel
+
     @contextmanager
     def _channel(self):
-        with (
-            grpc.secure_channel(self._server_address, self._ssl_creds)
-            if self._use_ssl
-            else grpc.insecure_channel(self._server_address)
-        ) as channel:
-            yield channel
+        reused_channel = self._get_reused_channel()
+        if reused_channel is not None:
+            yield reused_channel
+        else:
+            with self._create_channel() as channel:
+                yield channel
+
+    def close(self):
+        """Close the channel shared by queries on a client created with ``reuse_channel``. Any
+        later query on the client opens and closes a channel of its own."""
+        with self._reused_channel_lock:
+            self._reused_channel_closed = True
+            if self._reused_channel is not None:
+                self._reused_channel.close()
+                self._reused_channel = None
 
     def _query(self, method, request_type, timeout=None, **kwargs):
         with self._channel() as channel:
@@ -88,6 +182,25 @@ def _query(self, method, request_type, timeout=None, **kwargs):
         # TODO need error handling here
         return response
 
+    def _query_future(self, method, request_type, response_fn, timeout=None, **kwargs):
+        """Issue a unary query without blocking on its response, so that several independent
+        queries can be in flight at once. Errors surface when ``result`` is called on the returned
+        future."""
+        reused_channel = self._get_reused_channel()
+        if reused_channel is not None:
+            stub = DagsterApiStub(reused_channel)
+            future = getattr(stub, method).future(request_type(**kwargs), timeout=timeout)
+            return DagsterGrpcQueryFuture(future, response_fn)
+
+        channel = self._create_channel()
+        try:
+            stub = DagsterApiStub(channel)
+            future = getattr(stub, method).future(request_type(**kwargs), timeout=timeout)
+        except:
+            channel.close()
+            raise
+        return DagsterGrpcQueryFuture(future, response_fn, owned_channel=channel)
+
     def _streaming_query(self, method, request_type, **kwargs):
         with self._channel() as channel:
             stub = DagsterApiStub(channel)
@@ -104,6 +217,10 @@ def heartbeat(self, echo=""):
         res = self._query("Heartbeat", api_pb2.PingRequest, echo=echo)
         return res.echo
 
+    def heartbeat_future(self, echo=""):
+        check.str_param(echo, "echo")
+        return self._query_future("Heartbeat", api_pb2.PingRequest, lambda res: res.echo, echo=echo)
+
     def streaming_ping(self, sequence_length, echo):
         check.int_param(sequence_length, "sequence_length")
         check.str_param(echo, "echo")
@@ -123,6 +240,11 @@ def get_server_id(self, timeout=None):
         res = self._query("GetServerId", api_pb2.Empty, timeout=timeout)
         return res.server_id
 
+    def get_server_id_future(self, timeout=None):
+        return self._query_future(
+            "GetServerId", api_pb2.Empty, lambda res: res.server_id, timeout=timeout
+        )
+
     def execution_plan_snapshot(self, execution_plan_snapshot_args):
         check.inst_param(
             execution_plan_snapshot_args, "execution_plan_snapshot_args", ExecutionPlanSnapshotArgs
@@ -372,6 +494,123 @@ def health_check_query(self):
         return health_pb2.HealthCheckResponse.ServingStatus.Name(status_number)
 
 
+class _ClientHeartbeat:
+    def __init__(self, client, interval):
+        self._client_ref = weakref.ref(client)
+        self.interval = interval
+        self.is_active = True
+        self._pending_future = None
+
+    def send(self):
+        client = self._client_ref()
+        if client is None:
+            self.stop()
+            return
+
+        if self._pending_future:
+            if not self._pending_future.done():
+                # Still waiting on the server to answer the last heartbeat
+                return
+
+            pending_future, self._pending_future = self._pending_future, None
+            try:
+                pending_future.result()
+            except grpc.RpcError:
+                pass
+
+        self._pending_future = client.heartbeat_future("ping")
+
+    def stop(self):
+        self.is_active = False
+        if self._pending_future:
+            self._pending_future.cancel()
+            self._pending_future = None
+
+
+class ClientHeartbeatScheduler:
+    """Sends heartbeats to the servers behind any number of clients from a single thread.
+
+    Each registered client is pinged every ``interval`` seconds until it is unregistered.
+    Heartbeats are issued without waiting on the response, so one slow server doesn't hold up
+    heartbeats to the rest. The thread is started on first use.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._wakeup_event = threading.Event()
+        self._heap = []
+        self._sequence = itertools.count()
+        self._thread = None
+
+    def register(self, client, interval=CLIENT_HEARTBEAT_INTERVAL):
+        check.inst_param(client, "client", DagsterGrpcClient)
+        check.numeric_param(interval, "interval")
+
+        heartbeat = _ClientHeartbeat(client, interval)
+        with self._lock:
+            self._schedule(heartbeat, time.monotonic() + interval)
+
+            # Also covers a thread that didn't survive a fork
+            if not self._thread or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="grpc-client-heartbeat", daemon=True
+                )
+                self._thread.start()
+
+        self._wakeup_event.set()
+        return heartbeat
+
+    def unregister(self, heartbeat):
+        check.inst_param(heartbeat, "heartbeat", _ClientHeartbeat)
+        # Only flags the heartbeat, without taking any locks, so that heartbeats can be
+        # unregistered from anywhere. The scheduler thread stops it the next time it comes due.
+        heartbeat.is_active = False
+
+    def _schedule(self, heartbeat, deadline):
+        heapq.heappush(self._heap, (deadline, next(self._sequence), heartbeat))
+
+    def _run(self):
+        while True:
+            self._wakeup_event.clear()
+
+            now = time.monotonic()
+            due_heartbeats = []
+            with self._lock:
+                while self._heap and self._heap[0][0] <= now:
+                    _deadline, _sequence, heartbeat = heapq.heappop(self._heap)
+                    due_heartbeats.append(heartbeat)
+
+            # Sent without holding the lock, so that nothing that happens while sending (e.g. a
+            # garbage collection that finalizes a location handle) can be held up by it
+            for heartbeat in due_heartbeats:
+                if heartbeat.is_active:
+                    # Every registered client shares this thread, so an unexpected error sending
+                    # one heartbeat mustn't stop heartbeats to the rest
+                    try:
+                        heartbeat.send()
+                    except Exception:  # pylint: disable=broad-except
+                        _logger.error(
+                            "Error sending gRPC client heartbeat:\n{}".format(
+                                serializable_error_info_from_exc_info(sys.exc_info())
+                            )
+                        )
+
+                if not heartbeat.is_active:
+                    heartbeat.stop()
+
+            with self._lock:
+                for heartbeat in due_heartbeats:
+                    if heartbeat.is_active:
+                        self._schedule(heartbeat, now + heartbeat.interval)
+
+                timeout = self._heap[0][0] - now if self._heap else None
+
+            self._wakeup_event.wait(timeout)
+
+
+CLIENT_HEARTBEAT_SCHEDULER = ClientHeartbeatScheduler()
+
+
 class EphemeralDagsterGrpcClient(DagsterGrpcClient):
     """A client that tells the server process that created it to shut down once it leaves a
     context manager."""
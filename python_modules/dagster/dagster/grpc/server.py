@@ -361,6 +361,9 @@ def ListRepositories(self, request, _context):
                 repository_code_pointer_dict=(
                     self._repository_symbols_and_code_pointers.code_pointers_by_repo_name
                 ),
+                current_image_result=GetCurrentImageResult(
+                    current_image=self._get_current_image(), serializable_error_info=None
+                ),
             )
         except Exception:  # pylint: disable=broad-except
             response = serializable_error_info_from_exc_info(sys.exc_info())
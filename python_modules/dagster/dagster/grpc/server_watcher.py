@@ -7,6 +7,27 @@
 WATCH_INTERVAL = 1
 REQUEST_TIMEOUT = 2
 MAX_RECONNECT_ATTEMPTS = 10
+# How often to check for shutdown while waiting on a response from the server
+SHUTDOWN_POLL_INTERVAL = 0.1
+
+
+class _WatchShutdown(Exception):
+    pass
+
+
+def _get_server_id(client, shutdown_event):
+    """Queries the server ID without blocking shutdown until the query times out. Raises
+    _WatchShutdown if shutdown_event is set before the server responds."""
+    future = client.get_server_id_future(timeout=REQUEST_TIMEOUT)
+    done_event = threading.Event()
+    future.add_done_callback(lambda _future: done_event.set())
+
+    # Wakes as soon as the server responds, checking for shutdown in between
+    while not done_event.wait(SHUTDOWN_POLL_INTERVAL):
+        if shutdown_event.is_set():
+            future.cancel()
+            raise _WatchShutdown()
+    return future.result()
 
 
 def watch_grpc_server_thread(
@@ -71,7 +92,7 @@ def watch_for_changes():
                 break
 
             curr = current_server_id()
-            new_server_id = client.get_server_id(timeout=REQUEST_TIMEOUT)
+            new_server_id = _get_server_id(client, shutdown_event)
             if curr is None:
                 set_server_id(new_server_id)
             elif curr != new_server_id:
@@ -88,7 +109,7 @@ def reconnect_loop():
                 return False
 
             try:
-                new_server_id = client.get_server_id(timeout=REQUEST_TIMEOUT)
+                new_server_id = _get_server_id(client, shutdown_event)
                 if current_server_id() == new_server_id:
                     # Intermittent failure, was able to reconnect to the same server
                     on_reconnected()
@@ -97,21 +118,24 @@ def reconnect_loop():
                     on_updated(new_server_id)
                     set_server_id(new_server_id)
                     return False
-            except grpc._channel._InactiveRpcError:  # pylint: disable=protected-access
+            except grpc.RpcError:
                 attempts += 1
 
         on_error()
         return False
 
-    while True:
-        try:
-            watch_for_changes()
-            return
-        except grpc._channel._InactiveRpcError:  # pylint: disable=protected-access
-            on_disconnect()
-            reconnected_to_same_server = reconnect_loop()
-            if not reconnected_to_same_server:
+    try:
+        while True:
+            try:
+                watch_for_changes()
                 return
+            except grpc.RpcError:
+                on_disconnect()
+                reconnected_to_same_server = reconnect_loop()
+                if not reconnected_to_same_server:
+                    return
+    except _WatchShutdown:
+        return
 
 
 def create_grpc_watch_thread(
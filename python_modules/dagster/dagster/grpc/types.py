@@ -128,7 +128,7 @@ def __new__(cls, repository_name, attribute):
 class ListRepositoriesResponse(
     namedtuple(
         "_ListRepositoriesResponse",
-        "repository_symbols executable_path repository_code_pointer_dict",
+        "repository_symbols executable_path repository_code_pointer_dict current_image_result",
     )
 ):
     def __new__(
@@ -136,6 +136,7 @@ def __new__(
         repository_symbols,
         executable_path=None,
         repository_code_pointer_dict=None,
+        current_image_result=None,
     ):
         return super(ListRepositoriesResponse, cls).__new__(
             cls,
@@ -151,6 +152,11 @@ def __new__(
                 key_type=str,
                 value_type=CodePointer,
             ),
+            # Saves clients a separate GetCurrentImage query. Only None when the response comes
+            # from a server that predates this field.
+            current_image_result=check.opt_inst_param(
+                current_image_result, "current_image_result", GetCurrentImageResult
+            ),
         )
 
 
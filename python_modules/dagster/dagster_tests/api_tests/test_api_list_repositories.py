@@ -44,6 +44,8 @@ def test_sync_list_python_file_grpc():
     assert repository_code_pointer_dict["bar_repo"].python_file.endswith("api_tests_repo.py")
     assert repository_code_pointer_dict["bar_repo"].fn_name == "bar_repo"
 
+    assert response.current_image_result.current_image is None
+
 
 def test_sync_list_python_file_multi_repo_grpc():
     python_file = file_relative_path(__file__, "multiple_repos.py")
@@ -228,6 +230,7 @@ def test_sync_list_container_grpc(docker_grpc_client):
     loadable_repo_symbols = response.repository_symbols
 
     assert docker_grpc_client.get_current_image().current_image == get_test_project_docker_image()
+    assert response.current_image_result.current_image == get_test_project_docker_image()
 
     assert isinstance(loadable_repo_symbols, list)
     assert len(loadable_repo_symbols) == 1
@@ -0,0 +1,246 @@
+import gc
+import sys
+import threading
+import time
+
+from dagster import file_relative_path, pipeline, repository
+from dagster.core.code_pointer import CodePointer
+from dagster.core.definitions.reconstructable import ReconstructableRepository
+from dagster.core.host_representation.handle import (
+    _GRPC_CLIENT_CACHE_LOCK,
+    GrpcServerRepositoryLocationHandle,
+    InProcessRepositoryLocationHandle,
+    PipelineHandle,
+    RepositoryHandle,
+)
+from dagster.core.host_representation.origin import (
+    GrpcServerRepositoryLocationOrigin,
+    InProcessRepositoryLocationOrigin,
+)
+from dagster.core.test_utils import environ
+from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster.grpc.client import CLIENT_HEARTBEAT_SCHEDULER, DagsterGrpcClient
+from dagster.grpc.server import GrpcServerProcess
+from dagster.grpc.types import ListRepositoriesResponse
+
+
+@pipeline
+def noop_pipeline():
+    pass
+
+
+@repository
+def repo():
+    return [noop_pipeline]
+
+
+@repository
+def other_repo():
+    return [noop_pipeline]
+
+
+def _server_process():
+    return GrpcServerProcess(
+        loadable_target_origin=LoadableTargetOrigin(
+            executable_path=sys.executable,
+            attribute="repo",
+            python_file=file_relative_path(__file__, "test_handle.py"),
+        ),
+    )
+
+
+def test_handles_share_client():
+    with _server_process().create_ephemeral_client() as api_client:
+        origin = GrpcServerRepositoryLocationOrigin(
+            location_name="test",
+            port=api_client.port,
+            socket=api_client.socket,
+            host=api_client.host,
+        )
+
+        with origin.create_handle() as handle_one:
+            with origin.create_handle() as handle_two:
+                assert handle_one.client is handle_two.client
+                assert handle_two.repository_names == {"repo"}
+
+            # The shared client is still usable by the remaining handle
+            assert handle_one.client.get_server_id() == handle_one.server_id
+
+            client_one = handle_one.client
+
+        with origin.create_handle() as handle_three:
+            assert handle_three.client is not client_one
+            assert handle_three.server_id == handle_one.server_id
+
+
+def test_handle_container_image(mocker):
+    with environ({"DAGSTER_CURRENT_IMAGE": "foo/bar"}):
+        server_process = _server_process()
+
+    with server_process.create_ephemeral_client() as api_client:
+        origin = GrpcServerRepositoryLocationOrigin(
+            location_name="test",
+            port=api_client.port,
+            socket=api_client.socket,
+            host=api_client.host,
+        )
+        get_current_image_spy = mocker.spy(DagsterGrpcClient, "get_current_image")
+
+        # The server's list of repositories includes its image
+        with origin.create_handle() as handle:
+            assert handle.container_image == "foo/bar"
+        assert get_current_image_spy.call_count == 0
+
+        # Servers from before it was included are asked for the image separately
+        mocker.patch(
+            "dagster.core.host_representation.handle.sync_list_repositories_grpc",
+            return_value=ListRepositoriesResponse(
+                repository_symbols=[],
+                executable_path=sys.executable,
+                repository_code_pointer_dict={
+                    "repo": CodePointer.from_python_file(__file__, "repo", None)
+                },
+            ),
+        )
+        with origin.create_handle() as handle:
+            assert handle.container_image == "foo/bar"
+        assert get_current_image_spy.call_count == 1
+
+
+def test_unmanaged_handle_garbage_collected():
+    with _server_process().create_ephemeral_client() as api_client:
+        handle = GrpcServerRepositoryLocationOrigin(
+            location_name="test",
+            port=api_client.port,
+            socket=api_client.socket,
+            host=api_client.host,
+        ).create_handle()
+
+        finalizer = handle._finalizer  # pylint: disable=protected-access
+        assert finalizer.alive
+
+        # The server watch thread doesn't keep the handle alive
+        del handle
+        gc.collect()
+        assert not finalizer.alive
+
+
+def test_handle_collected_while_release_locks_held():
+    with _server_process().create_ephemeral_client() as api_client:
+        handles = [
+            GrpcServerRepositoryLocationHandle(
+                GrpcServerRepositoryLocationOrigin(
+                    location_name="test",
+                    port=api_client.port,
+                    socket=api_client.socket,
+                    host=api_client.host,
+                ),
+                heartbeat=True,
+            )
+        ]
+        # pylint: disable=protected-access
+        finalizer = handles[0]._finalizer
+        resources = handles[0]._resources
+        client = handles[0].client
+
+        def _collect_with_locks_held():
+            # Every lock that releasing the handle's resources takes
+            with _GRPC_CLIENT_CACHE_LOCK:
+                with CLIENT_HEARTBEAT_SCHEDULER._lock:
+                    with client._reused_channel_lock:
+                        handles.clear()
+                        gc.collect()
+
+        collect_thread = threading.Thread(target=_collect_with_locks_held, daemon=True)
+        collect_thread.start()
+        collect_thread.join(timeout=5)
+
+        # The finalizer ran without waiting on any of the locks
+        assert not collect_thread.is_alive()
+        assert not finalizer.alive
+
+        # and the resources are released on the release thread once the locks are free
+        start_time = time.time()
+        while resources.client_key or resources.heartbeat_registration:
+            assert time.time() - start_time < 10
+            time.sleep(0.1)
+
+        assert client._reused_channel_closed
+        # pylint: enable=protected-access
+
+
+def test_handle_origins_are_cached():
+    with _server_process().create_ephemeral_client() as api_client:
+        with GrpcServerRepositoryLocationOrigin(
+            location_name="test",
+            port=api_client.port,
+            socket=api_client.socket,
+            host=api_client.host,
+        ).create_handle() as handle:
+            repository_handle = RepositoryHandle("repo", handle)
+            assert repository_handle.get_external_origin() is (
+                repository_handle.get_external_origin()
+            )
+            assert repository_handle.get_python_origin() is repository_handle.get_python_origin()
+
+            pipeline_handle = PipelineHandle("noop_pipeline", repository_handle)
+            assert pipeline_handle.location_name == "test"
+            assert pipeline_handle.repository_name == "repo"
+            assert pipeline_handle.to_string() == "test.repo.noop_pipeline"
+            assert pipeline_handle.get_external_origin() is pipeline_handle.get_external_origin()
+            assert pipeline_handle.get_python_origin() is pipeline_handle.get_python_origin()
+            assert pipeline_handle.get_external_origin() == (
+                repository_handle.get_external_origin().get_pipeline_origin("noop_pipeline")
+            )
+
+            # Caching doesn't affect equality between handles
+            assert pipeline_handle == PipelineHandle("noop_pipeline", repository_handle)
+            assert hash(pipeline_handle) == hash(PipelineHandle("noop_pipeline", repository_handle))
+            assert pipeline_handle != PipelineHandle("other_pipeline", repository_handle)
+            assert pipeline_handle == PipelineHandle(
+                "noop_pipeline", RepositoryHandle("repo", handle)
+            )
+
+
+def test_in_process_handles_share_repository_def(mocker):
+    ReconstructableRepository.get_definition.cache_clear()
+    load_spy = mocker.spy(
+        sys.modules["dagster.core.definitions.reconstructable"], "repository_def_from_pointer"
+    )
+    origin = InProcessRepositoryLocationOrigin(
+        ReconstructableRepository.for_file(file_relative_path(__file__, "test_handle.py"), "repo")
+    )
+
+    with InProcessRepositoryLocationHandle(origin) as handle_one:
+        with InProcessRepositoryLocationHandle(origin) as handle_two:
+            assert handle_one.repository_code_pointer_dict == (
+                handle_two.repository_code_pointer_dict
+            )
+            assert list(handle_two.repository_code_pointer_dict.keys()) == ["repo"]
+
+            assert handle_two.create_location().get_repository_names() == ["repo"]
+
+    assert load_spy.call_count == 1
+
+
+def test_in_process_handles_for_several_origins_share_repository_defs(mocker):
+    ReconstructableRepository.get_definition.cache_clear()
+    load_spy = mocker.spy(
+        sys.modules["dagster.core.definitions.reconstructable"], "repository_def_from_pointer"
+    )
+    origins = [
+        InProcessRepositoryLocationOrigin(
+            ReconstructableRepository.for_file(
+                file_relative_path(__file__, "test_handle.py"), repository_name
+            )
+        )
+        for repository_name in ["repo", "other_repo"]
+    ]
+
+    # Alternating between origins doesn't evict either of their definitions
+    for _ in range(2):
+        for origin, repository_name in zip(origins, ["repo", "other_repo"]):
+            with InProcessRepositoryLocationHandle(origin) as handle:
+                assert list(handle.repository_code_pointer_dict.keys()) == [repository_name]
+
+    assert load_spy.call_count == 2
@@ -2,6 +2,7 @@
 import time
 
 from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster.grpc.client import ClientHeartbeatScheduler, DagsterGrpcClient
 from dagster.grpc.server import GrpcServerProcess
 from dagster.utils import file_relative_path
 
@@ -36,3 +37,66 @@ def test_heartbeat():
             time.sleep(0.1)
 
         raise Exception("Timed out waiting for server to terminate after heartbeat stopped")
+
+
+def test_heartbeat_scheduler():
+    loadable_target_origin = LoadableTargetOrigin(
+        executable_path=sys.executable,
+        attribute="bar_repo",
+        python_file=file_relative_path(__file__, "grpc_repo.py"),
+    )
+    server = GrpcServerProcess(
+        loadable_target_origin=loadable_target_origin,
+        max_workers=2,
+        heartbeat=True,
+        heartbeat_timeout=1,
+    )
+    with server.create_ephemeral_client() as client:
+        scheduler = ClientHeartbeatScheduler()
+        heartbeat = scheduler.register(client, interval=0.25)
+
+        # scheduled heartbeats keep the server alive
+        time.sleep(3)
+        assert server.server_process.poll() is None
+
+        scheduler.unregister(heartbeat)
+
+        start_time = time.time()
+        while (time.time() - start_time) < 10:
+            if server.server_process.poll() is not None:
+                return
+            time.sleep(0.1)
+
+        raise Exception("Timed out waiting for server to terminate after heartbeat stopped")
+
+
+class BrokenHeartbeatClient(DagsterGrpcClient):
+    def heartbeat_future(self, echo=""):
+        raise Exception("Unexpected heartbeat error")
+
+
+def test_heartbeat_scheduler_survives_errors():
+    loadable_target_origin = LoadableTargetOrigin(
+        executable_path=sys.executable,
+        attribute="bar_repo",
+        python_file=file_relative_path(__file__, "grpc_repo.py"),
+    )
+    server = GrpcServerProcess(
+        loadable_target_origin=loadable_target_origin,
+        max_workers=2,
+        heartbeat=True,
+        heartbeat_timeout=1,
+    )
+    with server.create_ephemeral_client() as client:
+        broken_client = BrokenHeartbeatClient(port=client.port, socket=client.socket)
+
+        scheduler = ClientHeartbeatScheduler()
+        broken_heartbeat = scheduler.register(broken_client, interval=0.25)
+        heartbeat = scheduler.register(client, interval=0.25)
+
+        # errors sending one client's heartbeats don't stop the others
+        time.sleep(3)
+        assert server.server_process.poll() is None
+
+        scheduler.unregister(heartbeat)
+        scheduler.unregister(broken_heartbeat)
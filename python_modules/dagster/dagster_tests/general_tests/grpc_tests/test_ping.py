@@ -1,5 +1,6 @@
 import os
 import re
+import socket as socket_lib
 import time
 
 import grpc
@@ -137,11 +138,63 @@ def test_streaming():
             assert result["echo"] == "foo"
 
 
+def test_reused_channel_client_usable_after_close():
+    with ephemeral_grpc_api_client() as api_client:
+        client = DagsterGrpcClient(
+            port=api_client.port, socket=api_client.socket, host=api_client.host, reuse_channel=True
+        )
+        assert client.ping("foo") == "foo"
+        assert client.get_server_id_future().result() == api_client.get_server_id()
+
+        client.close()
+
+        # Queries after close each use a channel of their own rather than opening a new shared
+        # channel that nothing would close
+        assert client.ping("foo") == "foo"
+        assert client.get_server_id_future().result() == api_client.get_server_id()
+        assert client._reused_channel is None  # pylint: disable=protected-access
+
+
 def test_get_server_id():
     with ephemeral_grpc_api_client() as api_client:
         assert api_client.get_server_id()
 
 
+def test_get_server_id_future():
+    with ephemeral_grpc_api_client() as api_client:
+        server_id_future = api_client.get_server_id_future()
+        assert server_id_future.result() == api_client.get_server_id()
+
+
+def test_client_bad_port_future():
+    port = find_free_port()
+    future = DagsterGrpcClient(port=port).get_server_id_future()
+    with pytest.raises(grpc.RpcError, match="failed to connect to all addresses"):
+        future.result()
+
+
+def test_future_result_timeout_leaves_query_in_flight():
+    # A socket that accepts connections but never responds, so the query stays in flight
+    unresponsive_socket = socket_lib.socket(socket_lib.AF_INET, socket_lib.SOCK_STREAM)
+    unresponsive_socket.bind(("localhost", 0))
+    unresponsive_socket.listen(1)
+
+    try:
+        future = DagsterGrpcClient(port=unresponsive_socket.getsockname()[1]).get_server_id_future(
+            timeout=30
+        )
+        with pytest.raises(grpc.FutureTimeoutError):
+            future.result(timeout=0.1)
+
+        # Timing out the wait didn't close the query's channel, which would have cancelled it
+        assert not future.done()
+
+        future.cancel()
+        assert future.done()
+    finally:
+        unresponsive_socket.close()
+
+
 def create_server_process():
     port = find_free_port()
     server_process = open_server_process(port=port, socket=None)
@@ -1,5 +1,6 @@
 # pylint: disable=cell-var-from-loop
 
+import socket
 import time
 
 import pytest
@@ -321,3 +322,27 @@ def should_not_be_called(*args, **kwargs):
     watch_thread.join()
 
     assert called["on_disconnect"]
+
+
+def test_grpc_watch_thread_shutdown_during_request():
+    # A socket that accepts connections but never responds, so the watcher's server ID query
+    # stays in flight until it times out
+    unresponsive_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    unresponsive_socket.bind(("localhost", 0))
+    unresponsive_socket.listen(1)
+
+    try:
+        client = DagsterGrpcClient(port=unresponsive_socket.getsockname()[1])
+        shutdown_event, watch_thread = create_grpc_watch_thread(client)
+        watch_thread.start()
+        time.sleep(0.5)
+
+        start_time = time.time()
+        shutdown_event.set()
+        watch_thread.join(timeout=5)
+
+        assert not watch_thread.is_alive()
+        # Well within the REQUEST_TIMEOUT that the query would otherwise block for
+        assert time.time() - start_time < 1
+    finally:
+        unresponsive_socket.close()
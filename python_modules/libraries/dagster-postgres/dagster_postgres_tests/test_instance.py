@@ -1,10 +1,15 @@
 import tempfile
+import threading
 
 import pytest
 import sqlalchemy as db
 import yaml
+from dagster import pipeline, solid
+from dagster.core.definitions.pipeline_base import InMemoryPipeline
+from dagster.core.execution.api import execute_run
 from dagster.core.instance import DagsterInstance, InstanceRef
-from dagster.core.test_utils import instance_for_test
+from dagster.core.storage.pipeline_run import PipelineRunStatus
+from dagster.core.test_utils import instance_for_test, poll_for_finished_run
 from dagster_postgres.utils import get_conn
 
 
@@ -91,3 +96,32 @@ def test_statement_timeouts(hostname):
         with pytest.raises(db.exc.OperationalError, match="QueryCanceled"):
             with instance._schedule_storage.connect() as conn:  # pylint: disable=protected-access
                 conn.execute("select pg_sleep(1)").fetchone()
+
+
+@solid
+def noop_solid(_):
+    pass
+
+
+@pipeline
+def noop_pipeline():
+    noop_solid()
+
+
+def test_poll_for_finished_run(hostname):
+    with instance_for_test(overrides=yaml.safe_load(full_pg_config(hostname))) as instance:
+        pipeline_run = instance.create_run_for_pipeline(noop_pipeline)
+
+        # Execute the run once polling has started, so that the poll has to watch for it to finish
+        execute_thread = threading.Timer(
+            0.5,
+            lambda: execute_run(InMemoryPipeline(noop_pipeline), pipeline_run, instance),
+        )
+        execute_thread.start()
+        try:
+            finished_run = poll_for_finished_run(instance, pipeline_run.run_id, timeout=30)
+        finally:
+            execute_thread.join()
+
+        assert finished_run.run_id == pipeline_run.run_id
+        assert finished_run.status == PipelineRunStatus.SUCCESS